@@ -4,40 +4,77 @@ Epic Validator MCP Server
 Provides custom tools for validating epic creation inputs
 """
 
-import json
 import os
 import re
 import subprocess
 import sys
 
+try:
+    import orjson as _json
+
+    _dumps = _json.dumps  # already returns UTF-8 bytes
+
+except ImportError:  # orjson is optional; fall back to the stdlib
+    import json as _json
+
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj).encode()
+
+# Trailing ":<line>" suffix editors append to paths (e.g. "spec.md:38")
+_LINE_NUMBER_RE = re.compile(r":\d+$")
+
+_SCRIPT_PATH = os.path.expanduser("~/.claude/scripts/epic-paths.sh")
+
+# Validation results keyed by cleaned path + mtimes of everything they depend on
+_VALIDATION_CACHE = {}
+
+
+def _mtime(path: str) -> int:
+    """Return mtime in nanoseconds, or 0 if the path cannot be stat'ed"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
 
 def validate_epic_creation(planning_doc_path: str) -> dict:
     """Validate epic creation inputs using the epic-paths.sh script"""
 
     # Clean path - remove line numbers
-    clean_path = re.sub(r":\d+$", "", planning_doc_path)
+    clean_path = _LINE_NUMBER_RE.sub("", planning_doc_path)
 
     try:
-        # Run the validation script
-        script_path = os.path.expanduser("~/.claude/scripts/epic-paths.sh")
-        result = subprocess.run(
-            [script_path, clean_path], capture_output=True, text=True, check=False
+        # Reuse a previous result while the planning doc, its directory (where
+        # the epic file gets created) and the script itself are unchanged
+        cache_key = (
+            clean_path,
+            _mtime(clean_path),
+            _mtime(os.path.dirname(os.path.realpath(clean_path))),
+            _mtime(_SCRIPT_PATH),
         )
+        cached = _VALIDATION_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
 
-        # Parse the output
-        output_lines = result.stdout.strip().split("\n")
+        # Run the validation script, parsing KEY=VALUE lines as they arrive
         validation_data = {}
 
-        for line in output_lines:
-            if "=" in line:
-                key, value = line.split("=", 1)
-                validation_data[key] = value
+        with subprocess.Popen(
+            [_SCRIPT_PATH, clean_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ) as proc:
+            for line in proc.stdout:
+                key, sep, value = line.rstrip("\n").partition("=")
+                if sep:
+                    validation_data[key] = value
 
         # Determine validation result
         spec_exists = validation_data.get("SPEC_EXISTS", "false") == "true"
         epic_exists = validation_data.get("EPIC_EXISTS", "false") == "true"
 
-        return {
+        validation = {
             "valid": spec_exists and not epic_exists,
             "spec_exists": spec_exists,
             "epic_exists": epic_exists,
@@ -47,91 +84,104 @@ def validate_epic_creation(planning_doc_path: str) -> dict:
             "error_message": validation_data.get("ERROR_MESSAGE", ""),
             "cleaned_path": clean_path,
         }
+        _VALIDATION_CACHE[cache_key] = validation
+        return dict(validation)
 
     except Exception as e:
         return {"valid": False, "error": str(e), "cleaned_path": clean_path}
 
 
-def handle_request(request):
-    """Handle MCP requests"""
-
-    if request["method"] == "tools/list":
-        return {
-            "tools": [
-                {
-                    "name": "validate_epic_creation",
-                    "description": (
-                        "Validate inputs for epic creation before starting work"
-                    ),
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "planning_doc_path": {
-                                "type": "string",
-                                "description": (
-                                    "Path to the planning document (.md file)"
-                                ),
-                            }
-                        },
-                        "required": ["planning_doc_path"],
-                    },
-                }
-            ]
+# The tool schema never changes, so the tools/list response is built once
+_TOOLS_LIST_RESPONSE = {
+    "tools": [
+        {
+            "name": "validate_epic_creation",
+            "description": "Validate inputs for epic creation before starting work",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "planning_doc_path": {
+                        "type": "string",
+                        "description": "Path to the planning document (.md file)",
+                    }
+                },
+                "required": ["planning_doc_path"],
+            },
         }
-
-    elif request["method"] == "tools/call":
-        tool_name = request["params"]["name"]
-        arguments = request["params"]["arguments"]
-
-        if tool_name == "validate_epic_creation":
-            result = validate_epic_creation(arguments["planning_doc_path"])
-
-            if result["valid"]:
+    ]
+}
+
+
+def _handle_tools_call(request):
+    """Handle an MCP tools/call request"""
+    tool_name = request["params"]["name"]
+    arguments = request["params"]["arguments"]
+
+    if tool_name == "validate_epic_creation":
+        result = validate_epic_creation(arguments["planning_doc_path"])
+
+        if result["valid"]:
+            content = (
+                f"✅ Validation passed!\n\n"
+                f"Planning document: {result['cleaned_path']}\n"
+                f"Target epic file: {result['epic_file']}\n\n"
+                f"Ready to proceed with epic creation."
+            )
+        else:
+            if not result["spec_exists"]:
+                error_msg = result.get('error_message', 'File does not exist')
+                content = (
+                    f"❌ Planning document not found: "
+                    f"{result['cleaned_path']}\n\n"
+                    f"Error: {error_msg}\n\n"
+                    f"Please provide a valid planning document path."
+                )
+            elif result["epic_exists"]:
                 content = (
-                    f"✅ Validation passed!\n\n"
-                    f"Planning document: {result['cleaned_path']}\n"
-                    f"Target epic file: {result['epic_file']}\n\n"
-                    f"Ready to proceed with epic creation."
+                    f"❌ Epic file already exists: {result['epic_file']}\n\n"
+                    f"Please remove the existing file or use a different name."
                 )
             else:
-                if not result["spec_exists"]:
-                    error_msg = result.get('error_message', 'File does not exist')
-                    content = (
-                        f"❌ Planning document not found: "
-                        f"{result['cleaned_path']}\n\n"
-                        f"Error: {error_msg}\n\n"
-                        f"Please provide a valid planning document path."
-                    )
-                elif result["epic_exists"]:
-                    content = (
-                        f"❌ Epic file already exists: {result['epic_file']}\n\n"
-                        f"Please remove the existing file or use a different name."
-                    )
-                else:
-                    content = (
-                        f"❌ Validation failed: {result.get('error', 'Unknown error')}"
-                    )
-
-            return {"content": [{"type": "text", "text": content}], "_meta": result}
+                content = (
+                    f"❌ Validation failed: {result.get('error', 'Unknown error')}"
+                )
+
+        return {"content": [{"type": "text", "text": content}], "_meta": result}
 
     return {"error": "Unknown method"}
 
 
+_DISPATCH = {
+    "tools/list": lambda request: _TOOLS_LIST_RESPONSE,
+    "tools/call": _handle_tools_call,
+}
+
+
+def handle_request(request):
+    """Handle MCP requests"""
+    handler = _DISPATCH.get(request["method"])
+    if handler is None:
+        return {"error": "Unknown method"}
+    return handler(request)
+
+
 def main():
     """Main MCP server loop"""
-    while True:
+    # Both orjson and json work with bytes, so read and write raw UTF-8 and
+    # skip the decode/encode round trip through text streams
+    out = sys.stdout.buffer
+    for line in sys.stdin.buffer:
         try:
-            line = input()
-            request = json.loads(line)
+            request = _json.loads(line)
             response = handle_request(request)
-            print(json.dumps(response))
-            sys.stdout.flush()
-        except EOFError:
-            break
+            out.write(_dumps(response))
+            out.write(b"\n")
+            out.flush()
         except Exception as e:
             error_response = {"error": str(e)}
-            print(json.dumps(error_response))
-            sys.stdout.flush()
+            out.write(_dumps(error_response))
+            out.write(b"\n")
+            out.flush()
 
 
 if __name__ == "__main__":
@@ -2,15 +2,20 @@
 
 import json
 import logging
+import os
+import re
 import subprocess
+from array import array
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import typer
 from rich.console import Console
 
 from cli.core.claude import ClaudeRunner
-from cli.core.context import ProjectContext
+from cli.core.context import ProjectContext, get_project_context
 from cli.core.prompts import PromptBuilder
 from cli.utils.epic_validator import parse_epic_yaml, validate_ticket_count
 from cli.utils.path_resolver import PathResolutionError, resolve_file_argument
@@ -18,13 +23,75 @@ from cli.utils.path_resolver import PathResolutionError, resolve_file_argument
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Possible start of a JSON object in free-form output, e.g. {"split_epics": ...}
+_JSON_OBJECT_START_RE = re.compile(r'\{\s*"')
+_JSON_DECODER = json.JSONDecoder()
 
-def parse_specialist_output(output: str) -> List[Dict]:
+# Trailing -spec/_spec on a planning doc name, e.g. user-auth-spec -> user-auth
+_SPEC_SUFFIX_RE = re.compile(r'[-_]spec$')
+
+
+@lru_cache(maxsize=8)
+def _resolve_epics_root(cwd: str) -> Path:
+    return (Path(cwd) / ".epics").resolve()
+
+
+def _epics_root() -> Path:
+    """Return the resolved .epics/ directory for the current working directory.
+
+    Resolution is cached per working directory so repeated security checks do
+    not re-walk the path.
+    """
+    return _resolve_epics_root(os.getcwd())
+
+
+def _is_within_epics_root(path: Path) -> bool:
+    """Check whether a resolved path lies inside the .epics/ directory.
+
+    Compares path components rather than string prefixes, so a sibling such
+    as .epics-old/ is not mistaken for part of .epics/.
+    """
+    try:
+        path.relative_to(_epics_root())
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=128)
+def _parse_epic_yaml_cached(epic_path: str, mtime_ns: int) -> Dict:
+    return parse_epic_yaml(epic_path)
+
+
+def parse_epic_yaml_cached(epic_path: str) -> Dict:
+    """
+    Parse epic YAML, reusing the result while the file is unchanged.
+
+    Results are keyed by path and modification time, so the same epic is
+    parsed once even when several steps of the split workflow need it.
+    The returned dict is shared between callers and must not be mutated.
+
+    Args:
+        epic_path: Path to epic YAML file
+
+    Returns:
+        dict with keys: 'ticket_count', 'epic', 'tickets'
+    """
+    try:
+        mtime_ns = os.stat(epic_path).st_mtime_ns
+    except OSError:
+        # Let parse_epic_yaml raise its usual error for missing files
+        return parse_epic_yaml(epic_path)
+    return _parse_epic_yaml_cached(epic_path, mtime_ns)
+
+
+def parse_specialist_output(output: Union[str, bytes]) -> List[Dict]:
     """
     Parse specialist agent output to extract split epic information.
 
     Args:
-        output: Specialist agent stdout containing split epic data
+        output: Specialist agent stdout containing split epic data (raw bytes
+            are scanned without decoding the whole output)
 
     Returns:
         List of dicts with 'name', 'path', 'ticket_count' for each split epic
@@ -34,27 +101,87 @@ def parse_specialist_output(output: str) -> List[Dict]:
     """
     # Look for JSON output block in the specialist output
     # Expected format: {"split_epics": [{"name": "epic1", "path": "...", "ticket_count": N}, ...]}
-    try:
-        # Try to find JSON block in output
-        lines = output.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('{') and 'split_epics' in line:
-                data = json.loads(line)
-                if 'split_epics' in data:
-                    return data['split_epics']
+    if isinstance(output, bytes):
+        # Only the bytes from the first brace onwards need decoding
+        brace = output.find(b"{")
+        output = output[brace:].decode(errors="replace") if brace != -1 else ""
+
+    # Try each object start in turn: the agent may mention the format in
+    # prose before printing the real result
+    error = None
+    end = 0
+    for match in _JSON_OBJECT_START_RE.finditer(output):
+        if match.start() < end:
+            # Nested inside an object already decoded
+            continue
+        try:
+            data, end = _JSON_DECODER.raw_decode(output, match.start())
+        except json.JSONDecodeError as e:
+            error = e
+            continue
+        if isinstance(data, dict) and 'split_epics' in data:
+            return data['split_epics']
 
-        # If no JSON found, raise error
-        raise RuntimeError("Could not find split_epics JSON in specialist output")
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse specialist output as JSON: {e}")
+    if error is not None:
+        raise RuntimeError(f"Failed to parse specialist output as JSON: {error}")
+    raise RuntimeError("Could not find split_epics JSON in specialist output")
+
+
+def _collect_split_epics_output(lines: Iterable[bytes]) -> bytes:
+    """
+    Keep the part of streamed specialist stdout that can hold the result.
+
+    Collection starts at the first line containing a brace, so a
+    pretty-printed object whose opening brace sits on its own line stays
+    whole. parse_specialist_output then locates the object within the kept
+    bytes.
+
+    Args:
+        lines: Specialist stdout, one bytes line at a time
+
+    Returns:
+        Output from the first candidate line onwards (empty if none matched)
+    """
+    candidate_lines = []
+    for line in lines:
+        if candidate_lines or b"{" in line:
+            candidate_lines.append(line)
+    return b"".join(candidate_lines)
+
+
+def _build_dependency_graph(tickets: List[Dict]) -> Tuple[List[str], List[List[int]]]:
+    """
+    Convert tickets into an integer-indexed dependency graph.
+
+    Args:
+        tickets: List of ticket dicts with 'id' and 'depends_on' fields
+
+    Returns:
+        (ticket_ids, deps) tuple - deps[i] lists the indices ticket_ids[i]
+        depends on; dependencies on tickets outside the epic are dropped
+    """
+    # Build ticket ID to dependencies mapping (last definition of an ID wins);
+    # tickets without dependencies share one empty tuple
+    ticket_deps = {
+        ticket.get('id', ''): ticket.get('depends_on') or () for ticket in tickets
+    }
+
+    ticket_ids = list(ticket_deps)
+    id_to_idx = {ticket_id: i for i, ticket_id in enumerate(ticket_ids)}
+    deps = [
+        [id_to_idx[dep] for dep in ticket_deps[ticket_id] if dep in id_to_idx]
+        for ticket_id in ticket_ids
+    ]
+    return ticket_ids, deps
 
 
 def detect_circular_dependencies(tickets: List[Dict]) -> List[Set[str]]:
     """
     Detect circular dependency groups that must stay together.
 
-    Uses depth-first search to detect cycles in the dependency graph.
+    Runs an iterative Tarjan strongly-connected-components pass over the
+    dependency graph, so every ticket and edge is visited once and deep
+    chains cannot hit Python's recursion limit.
 
     Args:
         tickets: List of ticket dicts with 'id' and 'depends_on' fields
@@ -62,57 +189,173 @@ def detect_circular_dependencies(tickets: List[Dict]) -> List[Set[str]]:
     Returns:
         List of sets containing ticket IDs that have circular dependencies
     """
-    # Build ticket ID to dependencies mapping
-    ticket_deps = {}
-    for ticket in tickets:
-        ticket_id = ticket.get('id', '')
-        depends_on = ticket.get('depends_on', [])
-        ticket_deps[ticket_id] = set(depends_on) if depends_on else set()
-
-    # Track visited tickets and current path for cycle detection
-    visited = set()
-    rec_stack = set()
-    circular_groups = []
+    ticket_ids, deps = _build_dependency_graph(tickets)
+    _, components = _strongly_connected_components(deps)
+    return _circular_groups(ticket_ids, deps, components)
 
-    def dfs(ticket_id: str, path: List[str]) -> Optional[List[str]]:
-        """DFS to detect cycles. Returns cycle if found."""
-        if ticket_id in rec_stack:
-            # Found a cycle - return the cycle portion
-            cycle_start = path.index(ticket_id)
-            return path[cycle_start:]
 
-        if ticket_id in visited:
-            return None
+def _strongly_connected_components(
+    deps: List[List[int]],
+) -> Tuple[array, List[List[int]]]:
+    """
+    Group tickets into strongly connected components with iterative Tarjan.
 
-        visited.add(ticket_id)
-        rec_stack.add(ticket_id)
-        path.append(ticket_id)
+    Tarjan completes a component only after every component it depends on,
+    so the components come out in dependency-first topological order of the
+    condensation graph.
 
-        # Visit dependencies
-        for dep in ticket_deps.get(ticket_id, set()):
-            cycle = dfs(dep, path[:])
-            if cycle:
-                return cycle
+    Args:
+        deps: Integer-indexed dependency lists from _build_dependency_graph
 
-        rec_stack.remove(ticket_id)
-        return None
+    Returns:
+        (component_of, components) tuple - component_of[v] is the index into
+        components of ticket v's component; each component lists its tickets
+    """
+    n = len(deps)
+
+    # Tarjan bookkeeping: DFS discovery index (-1 = unvisited) and lowest
+    # reachable index per ticket, plus the stack of tickets whose component
+    # is not yet complete
+    index = array('i', [-1]) * n
+    lowlink = array('i', [0]) * n
+    on_stack = bytearray(n)
+    scc_stack: List[int] = []
+    counter = 0
+    component_of = array('i', [-1]) * n
+    components: List[List[int]] = []
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
 
-    # Check each ticket for cycles
-    for ticket_id in ticket_deps.keys():
-        if ticket_id not in visited:
-            cycle = dfs(ticket_id, [])
-            if cycle:
-                circular_groups.append(set(cycle))
-                logger.info(f"Detected circular dependency group: {cycle}")
+        index[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack[root] = 1
+        work_stack = [(root, iter(deps[root]))]
+
+        while work_stack:
+            v, v_deps = work_stack[-1]
+            for u in v_deps:
+                if index[u] == -1:
+                    # Descend into the dependency; resume this iterator later
+                    index[u] = lowlink[u] = counter
+                    counter += 1
+                    scc_stack.append(u)
+                    on_stack[u] = 1
+                    work_stack.append((u, iter(deps[u])))
+                    break
+                if on_stack[u] and index[u] < lowlink[v]:
+                    lowlink[v] = index[u]
+            else:
+                # All dependencies explored - finish this ticket
+                work_stack.pop()
+                if work_stack:
+                    parent = work_stack[-1][0]
+                    if lowlink[v] < lowlink[parent]:
+                        lowlink[parent] = lowlink[v]
+
+                if lowlink[v] == index[v]:
+                    # v is the root of a component - pop it off
+                    members = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack[member] = 0
+                        component_of[member] = len(components)
+                        members.append(member)
+                        if member == v:
+                            break
+                    components.append(members)
+
+    return component_of, components
+
+
+def _circular_groups(
+    ticket_ids: List[str], deps: List[List[int]], components: List[List[int]]
+) -> List[Set[str]]:
+    """Run detect_circular_dependencies on already-computed components."""
+    circular_groups = []
+    for members in components:
+        if len(members) > 1 or members[0] in deps[members[0]]:
+            group = {ticket_ids[member] for member in members}
+            circular_groups.append(group)
+            logger.info(f"Detected circular dependency group: {sorted(group)}")
 
     return circular_groups
 
 
+def _chain_lengths(
+    deps: List[List[int]],
+    component_of: array,
+    components: List[List[int]],
+    max_length: Optional[int] = None,
+) -> Tuple[array, array, int]:
+    """
+    Compute the longest dependency chain starting at each component.
+
+    Works on the condensation of the dependency graph: a circular group is a
+    single link that contributes all of its tickets to the chain, so tickets
+    built on top of a cycle still get a chain length. Components arrive
+    dependencies first, so each chain length is final when it is computed.
+
+    Args:
+        deps: Integer-indexed dependency lists from _build_dependency_graph
+        component_of: Component index per ticket from
+            _strongly_connected_components
+        components: Components from _strongly_connected_components
+        max_length: If set, stop as soon as a chain longer than this is found
+
+    Returns:
+        (chain_len, next_comp, found) tuple - chain_len[c] counts
+        tickets on the longest chain from component c, next_comp[c] links to
+        the component continuing it (-1 at the deepest one); found is the
+        component whose chain exceeded max_length, or -1
+    """
+    chain_len = array('i', [0]) * len(components)
+    next_comp = array('i', [-1]) * len(components)
+
+    for c, members in enumerate(components):
+        best_len = 0
+        best_next = -1
+        for v in members:
+            for u in deps[v]:
+                d = component_of[u]
+                if d != c and chain_len[d] > best_len:
+                    best_len = chain_len[d]
+                    best_next = d
+
+        chain_len[c] = len(members) + best_len
+        next_comp[c] = best_next
+
+        if max_length is not None and chain_len[c] > max_length:
+            return chain_len, next_comp, c
+
+    return chain_len, next_comp, -1
+
+
+def _follow_chain(
+    ticket_ids: List[str], components: List[List[int]], next_comp: array, c: int
+) -> List[str]:
+    """Rebuild the ticket ID chain starting at component c via next_comp."""
+    path = []
+    while c != -1:
+        # Circular groups list their tickets in epic order
+        path.extend(ticket_ids[v] for v in sorted(components[c]))
+        c = next_comp[c]
+    return path
+
+
 def detect_long_chains(tickets: List[Dict]) -> List[List[str]]:
     """
     Detect long dependency chains that cannot be split.
 
-    Finds the longest path from any ticket to its deepest dependency.
+    Finds the longest path from any ticket to its deepest dependency with a
+    single dynamic-programming sweep over the condensation graph (O(V+E)).
+    A circular dependency group counts as one link holding all of its
+    tickets, so chains running through or above a cycle are still measured.
+
+    Only maximal chains are reported: a chain that is the tail of another
+    reported chain is not listed again on its own.
 
     Args:
         tickets: List of ticket dicts with 'id' and 'depends_on' fields
@@ -120,58 +363,79 @@ def detect_long_chains(tickets: List[Dict]) -> List[List[str]]:
     Returns:
         List of ticket ID lists representing dependency chains (longest first)
     """
-    # Build ticket ID to dependencies mapping
-    ticket_deps = {}
-    for ticket in tickets:
-        ticket_id = ticket.get('id', '')
-        depends_on = ticket.get('depends_on', [])
-        ticket_deps[ticket_id] = set(depends_on) if depends_on else set()
-
-    # Find all paths using DFS
-    def find_longest_path(ticket_id: str, visited: Set[str]) -> List[str]:
-        """Find longest path from this ticket."""
-        if ticket_id in visited:
-            # Cycle detected, return empty to avoid infinite loop
-            return []
-
-        visited = visited | {ticket_id}
-        dependencies = ticket_deps.get(ticket_id, set())
-
-        if not dependencies:
-            return [ticket_id]
-
-        # Find longest path through dependencies
-        longest = []
-        for dep in dependencies:
-            path = find_longest_path(dep, visited)
-            if len(path) > len(longest):
-                longest = path
-
-        return [ticket_id] + longest
-
-    # Calculate longest path for each ticket
-    all_paths = []
-    for ticket_id in ticket_deps.keys():
-        path = find_longest_path(ticket_id, set())
-        if path:
-            all_paths.append(path)
-
-    # Sort by length (longest first) and deduplicate
-    all_paths.sort(key=len, reverse=True)
-
-    # Return unique long chains (>= 12 tickets is considered long)
-    seen = set()
-    long_chains = []
-    for path in all_paths:
-        path_key = tuple(path)
-        if path_key not in seen and len(path) >= 12:
-            long_chains.append(path)
-            seen.add(path_key)
-            logger.info(f"Detected long dependency chain ({len(path)} tickets): {path}")
+    ticket_ids, deps = _build_dependency_graph(tickets)
+    component_of, components = _strongly_connected_components(deps)
+    chain_len, next_comp, _ = _chain_lengths(deps, component_of, components)
+
+    # A component whose chain some other component continues only heads a suffix
+    extended = bytearray(len(components))
+    for d in next_comp:
+        if d != -1:
+            extended[d] = 1
+
+    # Return long chains (>= 12 tickets is considered long)
+    heads = [
+        c for c in range(len(components)) if chain_len[c] >= 12 and not extended[c]
+    ]
+    heads.sort(key=chain_len.__getitem__, reverse=True)
+
+    long_chains = [_follow_chain(ticket_ids, components, next_comp, c) for c in heads]
+    for path in long_chains:
+        logger.info(f"Detected long dependency chain ({len(path)} tickets): {path}")
 
     return long_chains
 
 
+def find_chain_longer_than(tickets: List[Dict], max_length: int) -> Optional[List[str]]:
+    """
+    Find a dependency chain with more than max_length tickets.
+
+    Stops scanning as soon as one such chain is found, so an epic that is
+    already disqualified does not pay for a full analysis. The chain
+    returned is the first one found and may be the tail of a longer one,
+    so its length is only a lower bound.
+
+    Args:
+        tickets: List of ticket dicts with 'id' and 'depends_on' fields
+        max_length: Maximum number of tickets allowed in a chain
+
+    Returns:
+        Ticket IDs of the offending chain, or None if every chain fits
+    """
+    ticket_ids, deps = _build_dependency_graph(tickets)
+    component_of, components = _strongly_connected_components(deps)
+    return _chain_longer_than(ticket_ids, deps, component_of, components, max_length)
+
+
+def _chain_longer_than(
+    ticket_ids: List[str],
+    deps: List[List[int]],
+    component_of: array,
+    components: List[List[int]],
+    max_length: int,
+) -> Optional[List[str]]:
+    """Run find_chain_longer_than on already-computed components."""
+    _, next_comp, found = _chain_lengths(deps, component_of, components, max_length)
+    if found == -1:
+        return None
+    return _follow_chain(ticket_ids, components, next_comp, found)
+
+
+def _load_split_epic(split_epic: Dict) -> Optional[Tuple[str, List[Dict]]]:
+    """Load one split epic as (name, tickets), or None if it cannot be read."""
+    epic_path = split_epic.get('path')
+    if not epic_path or not os.path.exists(epic_path):
+        return None
+
+    try:
+        epic_content = parse_epic_yaml_cached(epic_path)
+    except Exception as e:
+        logger.warning(f"Could not parse split epic {epic_path}: {e}")
+        return None
+
+    return split_epic.get('name', epic_path), epic_content.get('tickets') or ()
+
+
 def validate_split_independence(split_epics: List[Dict], epic_data: Dict) -> Tuple[bool, str]:
     """
     Validate that split epics are fully independent with no cross-epic dependencies.
@@ -183,45 +447,44 @@ def validate_split_independence(split_epics: List[Dict], epic_data: Dict) -> Tup
     Returns:
         (is_valid, error_message) tuple - error_message is empty string if valid
     """
-    # Load each split epic and build ticket->epic mapping
-    ticket_to_epic = {}
-    split_epic_tickets = {}
+    # Load the split epics concurrently so their file reads overlap, then map
+    # every ticket to its epic here in input order
+    loaded_epics = []
+    if split_epics:
+        from concurrent.futures import ThreadPoolExecutor
 
-    for split_epic in split_epics:
-        epic_path = split_epic.get('path')
-        if not epic_path or not Path(epic_path).exists():
-            continue
+        with ThreadPoolExecutor(max_workers=min(8, len(split_epics))) as executor:
+            for loaded in executor.map(_load_split_epic, split_epics):
+                if loaded is not None:
+                    loaded_epics.append(loaded)
 
-        try:
-            epic_content = parse_epic_yaml(epic_path)
-            epic_name = split_epic.get('name', epic_path)
-            split_epic_tickets[epic_name] = epic_content.get('tickets', [])
-
-            # Map each ticket to its epic
-            for ticket in epic_content.get('tickets', []):
-                ticket_id = ticket.get('id', '')
-                ticket_to_epic[ticket_id] = epic_name
-        except Exception as e:
-            logger.warning(f"Could not parse split epic {epic_path}: {e}")
-            continue
-
-    # Check for cross-epic dependencies
-    for epic_name, tickets in split_epic_tickets.items():
+    ticket_to_epic = {}
+    for epic_name, tickets in loaded_epics:
         for ticket in tickets:
-            ticket_id = ticket.get('id', '')
-            depends_on = ticket.get('depends_on', [])
-
-            for dep in depends_on:
-                dep_epic = ticket_to_epic.get(dep)
-                if dep_epic and dep_epic != epic_name:
-                    error_msg = (
-                        f"Cross-epic dependency found: ticket '{ticket_id}' in epic "
-                        f"'{epic_name}' depends on '{dep}' in epic '{dep_epic}'"
-                    )
-                    logger.error(error_msg)
-                    return False, error_msg
-
-    return True, ""
+            ticket_to_epic[ticket.get('id', '')] = epic_name
+
+    # Check for cross-epic dependencies, stopping at the first one
+    violation = next(
+        (
+            (ticket.get('id', ''), epic_name, dep, dep_epic)
+            for epic_name, tickets in loaded_epics
+            for ticket in tickets
+            for dep in ticket.get('depends_on') or ()
+            for dep_epic in (ticket_to_epic.get(dep),)
+            if dep_epic and dep_epic != epic_name
+        ),
+        None,
+    )
+    if violation is None:
+        return True, ""
+
+    ticket_id, epic_name, dep, dep_epic = violation
+    error_msg = (
+        f"Cross-epic dependency found: ticket '{ticket_id}' in epic "
+        f"'{epic_name}' depends on '{dep}' in epic '{dep_epic}'"
+    )
+    logger.error(error_msg)
+    return False, error_msg
 
 
 def create_split_subdirectories(base_dir: str, epic_names: List[str]) -> List[str]:
@@ -244,25 +507,24 @@ def create_split_subdirectories(base_dir: str, epic_names: List[str]) -> List[st
         OSError: If directory creation fails
     """
     base_path = Path(base_dir).resolve()
-    epics_root = Path(".epics").resolve()
 
     # Security: Validate paths are within .epics/
-    if not str(base_path).startswith(str(epics_root)):
+    if not _is_within_epics_root(base_path):
         raise ValueError(f"Path {base_path} is outside .epics/ directory")
 
     created_dirs = []
 
     for epic_name in epic_names:
-        # Create epic subdirectory
+        # Create epic subdirectory and its tickets subdirectory in one call
         epic_dir = base_path / epic_name
-        epic_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create tickets subdirectory
-        tickets_dir = epic_dir / "tickets"
-        tickets_dir.mkdir(exist_ok=True)
+        os.makedirs(epic_dir / "tickets", exist_ok=True)
 
         created_dirs.append(str(epic_dir))
-        console.print(f"[green]Created directory: {epic_dir}[/green]")
+
+    if created_dirs:
+        console.print(
+            "\n".join(f"[green]Created directory: {d}[/green]" for d in created_dirs)
+        )
 
     return created_dirs
 
@@ -282,21 +544,21 @@ def archive_original_epic(epic_path: str) -> str:
         OSError: If file operation fails
     """
     epic_file = Path(epic_path).resolve()
-    epics_root = Path(".epics").resolve()
 
     # Security: Validate path is within .epics/
-    if not str(epic_file).startswith(str(epics_root)):
+    if not _is_within_epics_root(epic_file):
         raise ValueError(f"Path {epic_file} is outside .epics/ directory")
 
     # Create archived filename
-    archived_path = epic_file.with_suffix(epic_file.suffix + ".original")
+    archived_path = epic_file.with_name(epic_file.name + ".original")
 
-    # Warn if .original already exists
-    if archived_path.exists():
-        console.print(f"[yellow]Warning: {archived_path} already exists, overwriting[/yellow]")
+    # Warn if .original already exists; os.replace then overwrites it atomically
+    if archived_path.is_file():
+        console.print(
+            f"[yellow]Warning: {archived_path} already exists, overwriting[/yellow]"
+        )
 
-    # Rename file
-    epic_file.rename(archived_path)
+    os.replace(epic_file, archived_path)
     console.print(f"[green]Archived original epic: {archived_path}[/green]")
 
     return str(archived_path)
@@ -311,21 +573,42 @@ def display_split_results(split_epics: List[Dict], archived_path: str) -> None:
         archived_path: Path to archived original epic
     """
     total_epics = len(split_epics)
-    total_tickets = sum(e.get('ticket_count', 0) for e in split_epics)
+    total_tickets = 0
 
-    console.print(f"\n[green]✓ Epic split into {total_epics} independent deliverables ({total_tickets} tickets total)[/green]")
-    console.print("\n[bold]Created split epics:[/bold]")
+    # Build the per-epic lines and the ticket total in one pass
+    epic_lines = []
     for epic in split_epics:
         name = epic.get('name', 'unknown')
         path = epic.get('path', 'unknown')
         count = epic.get('ticket_count', 0)
-        console.print(f"  • {name}: {path} ({count} tickets)")
-
-    console.print(f"\n[dim]Original epic archived as: {archived_path}[/dim]")
-    console.print("\n[yellow]Execute each epic independently - no dependencies between them[/yellow]")
-
-
-def handle_split_workflow(epic_path: str, spec_path: str, ticket_count: int, context: ProjectContext) -> None:
+        total_tickets += count
+        epic_lines.append(f"  • {name}: {path} ({count} tickets)")
+
+    lines = [
+        f"\n[green]✓ Epic split into {total_epics} independent deliverables "
+        f"({total_tickets} tickets total)[/green]",
+        "\n[bold]Created split epics:[/bold]",
+        *epic_lines,
+    ]
+
+    lines.append(f"\n[dim]Original epic archived as: {archived_path}[/dim]")
+    lines.append(
+        "\n[yellow]Execute each epic independently - "
+        "no dependencies between them[/yellow]"
+    )
+
+    # One print call keeps large splits from flushing the terminal per line
+    console.print("\n".join(lines))
+
+
+def handle_split_workflow(
+    epic_path: str,
+    spec_path: str,
+    ticket_count: int,
+    context: ProjectContext,
+    epic_data: Optional[Dict] = None,
+    prompt_builder: Optional[PromptBuilder] = None,
+) -> None:
     """
     Orchestrate complete epic split process with edge case handling.
 
@@ -334,6 +617,8 @@ def handle_split_workflow(epic_path: str, spec_path: str, ticket_count: int, con
         spec_path: Path to spec document
         ticket_count: Number of tickets in epic
         context: Project context for prompt building
+        epic_data: Already-parsed epic YAML, to skip re-reading epic_path
+        prompt_builder: Existing PromptBuilder for context, to reuse
 
     Raises:
         RuntimeError: If split workflow fails
@@ -342,48 +627,71 @@ def handle_split_workflow(epic_path: str, spec_path: str, ticket_count: int, con
 
     try:
         # 1. Parse epic to analyze dependencies
-        epic_data = parse_epic_yaml(epic_path)
+        if epic_data is None:
+            epic_data = parse_epic_yaml_cached(epic_path)
         tickets = epic_data.get('tickets', [])
 
         # 2. Detect edge cases
         logger.info(f"Analyzing {len(tickets)} tickets for edge cases...")
 
+        # Build the dependency graph and its strongly connected components
+        # once; both checks below work from the same Tarjan pass
+        ticket_ids, deps = _build_dependency_graph(tickets)
+        component_of, components = _strongly_connected_components(deps)
+
         # Detect circular dependencies
-        circular_groups = detect_circular_dependencies(tickets)
+        circular_groups = _circular_groups(ticket_ids, deps, components)
         if circular_groups:
             console.print(f"[yellow]Warning: Found {len(circular_groups)} circular dependency groups. These will stay together.[/yellow]")
             for i, group in enumerate(circular_groups, 1):
                 logger.info(f"Circular group {i}: {group}")
 
-        # Detect long chains
-        long_chains = detect_long_chains(tickets)
-        if long_chains:
-            max_chain_length = max(len(chain) for chain in long_chains)
-            if max_chain_length > 12:
-                console.print(f"[red]Error: Epic has dependency chain of {max_chain_length} tickets (>12 limit).[/red]")
-                console.print("[red]Cannot split while preserving dependencies.[/red]")
-                console.print("[yellow]Recommendation: Review epic design to reduce coupling between tickets.[/yellow]")
-                logger.error(f"Long dependency chain detected: {long_chains[0]}")
-                return
+        # Detect long chains (stops at the first chain over the limit)
+        long_chain = _chain_longer_than(
+            ticket_ids, deps, component_of, components, 12
+        )
+        if long_chain:
+            console.print(
+                "[red]Error: Epic has a dependency chain of more than 12 tickets.[/red]"
+            )
+            console.print("[red]Cannot split while preserving dependencies.[/red]")
+            console.print(
+                "[yellow]Recommendation: Review epic design to reduce coupling "
+                "between tickets.[/yellow]"
+            )
+            # The scan stops once the limit is crossed, so this chain may be
+            # only the first part of a longer one
+            logger.error(f"Long dependency chain detected (partial): {long_chain}")
+            return
 
         # 3. Build specialist prompt with edge case context
-        prompt_builder = PromptBuilder(context)
+        if prompt_builder is None:
+            prompt_builder = PromptBuilder(context)
         specialist_prompt = prompt_builder.build_split_epic(epic_path, spec_path, ticket_count)
 
         # 4. Invoke Claude subprocess
         console.print("[blue]Invoking specialist agent to analyze and split epic...[/blue]")
-        result = subprocess.run(
-            ["claude", "--prompt", specialist_prompt],
-            capture_output=True,
-            text=True,
-            cwd=context.project_root
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"Specialist agent failed: {result.stderr}")
+        # Stream stdout as bytes and keep only the split_epics JSON result.
+        # stderr goes to a temp file so a chatty agent cannot fill its pipe
+        # and stall while we are reading stdout.
+        import tempfile
+
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                ["claude", "--prompt", specialist_prompt],
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                cwd=context.project_root
+            ) as proc:
+                output = _collect_split_epics_output(proc.stdout)
+
+            if proc.returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors="replace")
+                raise RuntimeError(f"Specialist agent failed: {stderr}")
 
         # 5. Parse specialist output to get epic names
-        split_epics = parse_specialist_output(result.stdout)
+        split_epics = parse_specialist_output(output)
 
         if not split_epics:
             raise RuntimeError("Specialist agent did not return any split epics")
@@ -398,14 +706,15 @@ def handle_split_workflow(epic_path: str, spec_path: str, ticket_count: int, con
             return
 
         # 7. Create subdirectories
-        base_dir = Path(epic_path).parent
-        epic_names = [e['name'] for e in split_epics]
-        created_dirs = create_split_subdirectories(str(base_dir), epic_names)
+        base_dir = os.path.dirname(epic_path)
+        epic_names = list(map(itemgetter('name'), split_epics))
+        created_dirs = create_split_subdirectories(base_dir, epic_names)
 
         console.print(f"[dim]Created {len(created_dirs)} subdirectories for split epics[/dim]")
 
         # 8. Archive original
         archived_path = archive_original_epic(epic_path)
+        _parse_epic_yaml_cached.cache_clear()
         console.print(f"[dim]Archived original epic to: {archived_path}[/dim]")
 
         # 9. Display results
@@ -418,6 +727,14 @@ def handle_split_workflow(epic_path: str, spec_path: str, ticket_count: int, con
         raise
 
 
+def _print_created(session_id: str) -> None:
+    """Report successful epic creation and its session ID in one render."""
+    console.print(
+        "\n[green]✓ Epic created successfully[/green]\n"
+        f"[dim]Session ID: {session_id}[/dim]"
+    )
+
+
 def command(
     planning_doc: str = typer.Argument(
         ...,
@@ -443,14 +760,16 @@ def command(
             raise typer.Exit(code=1) from e
 
         # Initialize context
-        context = ProjectContext(cwd=project_dir)
+        context = get_project_context(project_dir)
 
         # Print context info
-        console.print(f"[dim]Project root: {context.project_root}[/dim]")
-        console.print(f"[dim]Claude dir: {context.claude_dir}[/dim]")
+        console.print(
+            f"[dim]Project root: {context.project_root}[/dim]\n"
+            f"[dim]Claude dir: {context.claude_dir}[/dim]"
+        )
 
         # Resolve planning doc path
-        planning_doc_resolved = context.resolve_path(planning_doc)
+        planning_doc_resolved = context.resolve_path(str(planning_doc_path))
 
         # Build prompt
         builder = PromptBuilder(context)
@@ -469,32 +788,47 @@ def command(
         if exit_code == 0:
             # Post-execution: find and validate epic filename
             epic_dir = planning_doc_path.parent
-            expected_base = planning_doc_path.stem.replace('-spec', '').replace('_spec', '')
-
-            # Look for any YAML files created
-            yaml_files = sorted(epic_dir.glob('*.yaml'), key=lambda p: p.stat().st_mtime, reverse=True)
+            expected_base = _SPEC_SUFFIX_RE.sub('', planning_doc_path.stem)
 
+            # Single scandir pass over the YAML files created: track the newest
+            # correctly named epic and the newest file that still needs the .epic
+            # suffix. Only candidates are stat'ed (DirEntry caches the result),
+            # and no full sort is needed.
             epic_path = None
-            for yaml_file in yaml_files:
-                # Skip if already correctly named
-                if yaml_file.name.endswith('.epic.yaml'):
-                    epic_path = yaml_file
-                    continue
-
-                # Check if this looks like our epic (has the expected base name)
-                if expected_base in yaml_file.stem:
-                    # Rename to add .epic suffix
-                    correct_name = yaml_file.stem + '.epic.yaml'
-                    correct_path = yaml_file.parent / correct_name
-                    yaml_file.rename(correct_path)
-                    console.print(f"[dim]Renamed: {yaml_file.name} → {correct_name}[/dim]")
-                    epic_path = correct_path
-                    break
+            epic_mtime = -1
+            misnamed_epic = None
+            misnamed_mtime = -1
+            with os.scandir(epic_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith('.yaml') or not entry.is_file():
+                        continue
+                    if name.endswith('.epic.yaml'):
+                        mtime = entry.stat().st_mtime_ns
+                        if mtime > epic_mtime:
+                            epic_path, epic_mtime = Path(entry.path), mtime
+                    elif name.startswith(expected_base, 0, len(name) - len('.yaml')):
+                        # Looks like our epic (stem starts with the expected base)
+                        mtime = entry.stat().st_mtime_ns
+                        if mtime > misnamed_mtime:
+                            misnamed_epic, misnamed_mtime = Path(entry.path), mtime
+
+            if misnamed_epic:
+                # Rename to add .epic suffix
+                correct_name = misnamed_epic.stem + '.epic.yaml'
+                correct_path = misnamed_epic.with_name(correct_name)
+                misnamed_epic.rename(correct_path)
+                console.print(
+                    f"[dim]Renamed: {misnamed_epic.name} → {correct_name}[/dim]"
+                )
+                epic_path = correct_path
 
             # Validate ticket count and trigger split workflow if needed
-            if epic_path and epic_path.exists():
+            # (epic_path was just listed or renamed into place, so it exists)
+            if epic_path:
+                epic_file = str(epic_path)
                 try:
-                    epic_data = parse_epic_yaml(str(epic_path))
+                    epic_data = parse_epic_yaml_cached(epic_file)
                     ticket_count = epic_data['ticket_count']
 
                     if validate_ticket_count(ticket_count):
@@ -502,28 +836,26 @@ def command(
                         if no_split:
                             console.print(f"\n[yellow]Warning: --no-split flag set. Epic has {ticket_count} tickets which may be difficult to execute.[/yellow]")
                             console.print("[yellow]Recommendation: Epics with >= 13 tickets may take longer than 2 hours to execute.[/yellow]")
-                            console.print("\n[green]✓ Epic created successfully[/green]")
-                            console.print(f"[dim]Session ID: {session_id}[/dim]")
+                            _print_created(session_id)
                         else:
                             # Trigger split workflow
                             handle_split_workflow(
-                                epic_path=str(epic_path),
+                                epic_path=epic_file,
                                 spec_path=str(planning_doc_path),
                                 ticket_count=ticket_count,
-                                context=context
+                                context=context,
+                                epic_data=epic_data,
+                                prompt_builder=builder
                             )
                     else:
                         # Normal success path
-                        console.print("\n[green]✓ Epic created successfully[/green]")
-                        console.print(f"[dim]Session ID: {session_id}[/dim]")
+                        _print_created(session_id)
                 except Exception as e:
                     console.print(f"[yellow]Warning: Could not validate epic for splitting: {e}[/yellow]")
                     # Continue - don't fail epic creation on validation error
-                    console.print("\n[green]✓ Epic created successfully[/green]")
-                    console.print(f"[dim]Session ID: {session_id}[/dim]")
+                    _print_created(session_id)
             else:
-                console.print("\n[green]✓ Epic created successfully[/green]")
-                console.print(f"[dim]Session ID: {session_id}[/dim]")
+                _print_created(session_id)
         else:
             raise typer.Exit(code=exit_code)
 
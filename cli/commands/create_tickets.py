@@ -7,7 +7,7 @@ import typer
 from rich.console import Console
 
 from cli.core.claude import ClaudeRunner
-from cli.core.context import ProjectContext
+from cli.core.context import get_project_context
 from cli.core.prompts import PromptBuilder
 from cli.utils.path_resolver import PathResolutionError, resolve_file_argument
 
@@ -35,14 +35,14 @@ def command(
             raise typer.Exit(code=1) from e
 
         # Initialize context
-        context = ProjectContext(cwd=project_dir)
+        context = get_project_context(project_dir)
 
         # Print context info
         console.print(f"[dim]Project root: {context.project_root}[/dim]")
         console.print(f"[dim]Claude dir: {context.claude_dir}[/dim]")
 
         # Resolve epic file path
-        epic_file_resolved = context.resolve_path(epic_file)
+        epic_file_resolved = context.resolve_path(str(epic_file_path))
 
         # Build prompt
         builder = PromptBuilder(context)
@@ -12,7 +12,7 @@ from rich.live import Live
 from rich.table import Table
 
 from cli.core.claude import ClaudeRunner
-from cli.core.context import ProjectContext
+from cli.core.context import get_project_context
 from cli.core.prompts import PromptBuilder
 from cli.utils.commit_parser import extract_ticket_name
 from cli.utils.path_resolver import PathResolutionError, resolve_file_argument
@@ -181,7 +181,7 @@ def command(
             console.print(f"[red]ERROR:[/red] {e}")
             raise typer.Exit(code=1) from e
         # Initialize context
-        context = ProjectContext(cwd=project_dir)
+        context = get_project_context(project_dir)
 
         # Print context info
         console.print(f"[dim]Project root: {context.project_root}[/dim]")
@@ -7,7 +7,7 @@ import typer
 from rich.console import Console
 
 from cli.core.claude import ClaudeRunner
-from cli.core.context import ProjectContext
+from cli.core.context import get_project_context
 from cli.core.prompts import PromptBuilder
 from cli.utils.path_resolver import PathResolutionError, resolve_file_argument
 
@@ -46,7 +46,7 @@ def command(
                 console.print(f"[red]ERROR:[/red] {e}")
                 raise typer.Exit(code=1) from e
         # Initialize context
-        context = ProjectContext(cwd=project_dir)
+        context = get_project_context(project_dir)
 
         # Print context info
         console.print(f"[dim]Project root: {context.project_root}[/dim]")
@@ -2,7 +2,13 @@
 
 from cli.core.claude import ClaudeRunner
 from cli.core.config import Config
-from cli.core.context import ProjectContext
+from cli.core.context import ProjectContext, get_project_context
 from cli.core.prompts import PromptBuilder
 
-__all__ = ["ProjectContext", "PromptBuilder", "ClaudeRunner", "Config"]
+__all__ = [
+    "ProjectContext",
+    "PromptBuilder",
+    "ClaudeRunner",
+    "Config",
+    "get_project_context",
+]
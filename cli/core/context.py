@@ -1,7 +1,8 @@
 """Project context detection and path resolution."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
 class ProjectContext:
@@ -23,6 +24,8 @@ class ProjectContext:
             FileNotFoundError: If .claude directory not found locally or globally
         """
         self.cwd = cwd or Path.cwd()
+        # Both upward walks probe the same .claude/ directories; remember answers
+        self._claude_dir_probes: Dict[Path, bool] = {}
         self.project_root = self._find_project_root()
         self.claude_dir = self._find_claude_dir()
 
@@ -34,11 +37,26 @@ class ProjectContext:
         """
         current = self.cwd
         while current != current.parent:
-            if (current / ".git").exists() or (current / ".claude").is_dir():
+            if (current / ".git").exists() or self._has_claude_dir(current):
                 return current
             current = current.parent
         return self.cwd
 
+    def _has_claude_dir(self, directory: Path) -> bool:
+        """Check whether directory contains a .claude/ directory, probing it once.
+
+        Args:
+            directory: Directory to look in
+
+        Returns:
+            True if directory/.claude is a directory
+        """
+        found = self._claude_dir_probes.get(directory)
+        if found is None:
+            found = (directory / ".claude").is_dir()
+            self._claude_dir_probes[directory] = found
+        return found
+
     def _find_claude_dir(self) -> Path:
         """Locate .claude directory, preferring local project over global ~/.claude
         fallback.
@@ -52,9 +70,8 @@ class ProjectContext:
         # Walk up from cwd to find local .claude/
         current = self.cwd
         while current != current.parent:
-            claude_dir = current / ".claude"
-            if claude_dir.is_dir():
-                return claude_dir
+            if self._has_claude_dir(current):
+                return current / ".claude"
             current = current.parent
 
         # Check global fallback
@@ -86,3 +103,28 @@ class ProjectContext:
 
         # Relative to invocation directory
         return (self.cwd / resolved).resolve()
+
+
+@lru_cache(maxsize=8)
+def _cached_context(cwd: Path) -> ProjectContext:
+    return ProjectContext(cwd=cwd)
+
+
+def get_project_context(cwd: Optional[Path] = None) -> ProjectContext:
+    """Return a shared ProjectContext for cwd, detecting project markers only once.
+
+    The cache is keyed by the resolved working directory (Path.cwd() when cwd
+    is None), so a relative path such as Path(".") cannot return a context
+    detected from a different directory, and repeated invocations from the
+    same directory skip the directory tree walk.
+
+    Args:
+        cwd: Working directory to start detection from (default: Path.cwd())
+
+    Returns:
+        ProjectContext for the given working directory
+
+    Raises:
+        FileNotFoundError: If .claude directory not found locally or globally
+    """
+    return _cached_context((cwd or Path.cwd()).resolve())
@@ -3,6 +3,21 @@
 import re
 from typing import Optional
 
+# Commit message patterns, tried in order by parse_ticket_name_from_commit
+_BRANCH_RE = re.compile(r"ticket/([a-z0-9-]+)", re.IGNORECASE)
+_COMPLETED_RE = re.compile(r"completed\s+ticket:\s*([a-z0-9-]+)", re.IGNORECASE)
+_CONVENTIONAL_SCOPE_RE = re.compile(
+    r"^(?:feat|fix|docs|style|refactor|perf|test|chore|build|ci)\(([a-z0-9-]+)\):",
+    re.IGNORECASE | re.MULTILINE
+)
+_CONVENTIONAL_SUBJECT_RE = re.compile(
+    r"^(?:feat|fix|docs|style|refactor|perf|test|chore|build|ci):\s*([a-z0-9-]+)",
+    re.IGNORECASE | re.MULTILINE
+)
+_TICKET_TRAILER_RE = re.compile(
+    r"^ticket:\s*([a-z0-9-]+)", re.IGNORECASE | re.MULTILINE
+)
+
 
 def parse_ticket_name_from_commit(commit_message: str, fallback_sha: Optional[str] = None) -> str:
     """Extract ticket name from git commit message.
@@ -44,33 +59,25 @@ def parse_ticket_name_from_commit(commit_message: str, fallback_sha: Optional[st
 
     # Try to extract ticket name from branch-like patterns
     # Matches: "ticket/ticket-name" or "branch: ticket/ticket-name"
-    match = re.search(r"ticket/([a-z0-9-]+)", commit_message, re.IGNORECASE)
+    match = _BRANCH_RE.search(commit_message)
     if match:
         return match.group(1)
 
     # Try to extract from "Completed ticket:" pattern
     # Matches: "Completed ticket: ticket-name"
-    match = re.search(r"completed\s+ticket:\s*([a-z0-9-]+)", commit_message, re.IGNORECASE)
+    match = _COMPLETED_RE.search(commit_message)
     if match:
         return match.group(1)
 
     # Try to extract from conventional commit format with scope
     # Matches: "feat(ticket-name):", "fix(ticket-name):", "chore(ticket-name):", etc.
-    match = re.search(
-        r"^(?:feat|fix|docs|style|refactor|perf|test|chore|build|ci)\(([a-z0-9-]+)\):",
-        commit_message,
-        re.IGNORECASE | re.MULTILINE
-    )
+    match = _CONVENTIONAL_SCOPE_RE.search(commit_message)
     if match:
         return match.group(1)
 
     # Try to extract from conventional commit body with scope
     # Matches: "feat: ticket-name" or "fix: ticket-name" (ticket name at start after colon)
-    match = re.search(
-        r"^(?:feat|fix|docs|style|refactor|perf|test|chore|build|ci):\s*([a-z0-9-]+)",
-        commit_message,
-        re.IGNORECASE | re.MULTILINE
-    )
+    match = _CONVENTIONAL_SUBJECT_RE.search(commit_message)
     if match:
         # Ensure it looks like a ticket name (contains hyphens or is multi-word)
         ticket_candidate = match.group(1)
@@ -79,7 +86,7 @@ def parse_ticket_name_from_commit(commit_message: str, fallback_sha: Optional[st
 
     # Try to extract from commit body with "ticket:" or "Ticket:" prefix
     # Matches: "ticket: ticket-name" or "Ticket: ticket-name"
-    match = re.search(r"^ticket:\s*([a-z0-9-]+)", commit_message, re.IGNORECASE | re.MULTILINE)
+    match = _TICKET_TRAILER_RE.search(commit_message)
     if match:
         return match.group(1)
 
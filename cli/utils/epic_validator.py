@@ -3,8 +3,6 @@
 import os
 from typing import Dict
 
-import yaml
-
 
 def parse_epic_yaml(epic_file_path: str) -> Dict:
     """
@@ -28,9 +26,15 @@ def parse_epic_yaml(epic_file_path: str) -> Dict:
     if not os.path.exists(epic_file_path):
         raise FileNotFoundError(f"Epic file does not exist: {epic_file_path}")
 
+    # Imported here so CLI start-up does not pay for PyYAML
+    import yaml
+
+    # Prefer the libyaml-backed loader; same safe subset, much faster parsing
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
     try:
         with open(epic_file_path) as f:
-            epic_data = yaml.safe_load(f)
+            epic_data = yaml.load(f, Loader=loader)
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Failed to parse YAML file {epic_file_path}: {e}")
 
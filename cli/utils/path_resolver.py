@@ -1,5 +1,7 @@
 """Path resolution utilities for CLI arguments."""
 
+import os
+import stat
 from pathlib import Path
 from typing import Optional
 
@@ -33,21 +35,30 @@ def resolve_file_argument(
         PathResolutionError: If path cannot be resolved
     """
     # Strip line number notation
-    if ":" in arg:
-        arg = arg.split(":", 1)[0]
+    head, sep, _ = arg.partition(":")
+    if sep:
+        arg = head
 
     path = Path(arg)
 
+    # Single stat; branch on the mode bits instead of is_file() + is_dir()
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        mode = 0
+
     # If it's a file that exists, return it
-    if path.is_file():
+    if stat.S_ISREG(mode):
         return path
 
     # If it's a directory and we have a pattern, try to infer the file
-    if path.is_dir() and expected_pattern:
-        matching_files = [
-            f for f in path.iterdir()
-            if f.is_file() and expected_pattern.lower() in f.name.lower()
-        ]
+    if stat.S_ISDIR(mode) and expected_pattern:
+        pattern = expected_pattern.lower()
+        with os.scandir(path) as entries:
+            matching_files = [
+                Path(entry.path) for entry in entries
+                if pattern in entry.name.lower() and entry.is_file()
+            ]
 
         if len(matching_files) == 0:
             raise PathResolutionError(
@@ -63,7 +74,7 @@ def resolve_file_argument(
         return matching_files[0]
 
     # If it's a directory but no pattern provided
-    if path.is_dir():
+    if stat.S_ISDIR(mode):
         raise PathResolutionError(
             f"{arg_name.capitalize()} is a directory: {path}\n"
             f"Please specify the exact file."
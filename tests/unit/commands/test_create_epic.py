@@ -0,0 +1,424 @@
+"""Tests for create epic command helpers."""
+
+import os
+import tempfile
+
+import pytest
+import yaml
+
+from cli.commands.create_epic import (
+    _collect_split_epics_output,
+    create_split_subdirectories,
+    detect_circular_dependencies,
+    detect_long_chains,
+    find_chain_longer_than,
+    parse_epic_yaml_cached,
+    parse_specialist_output,
+    validate_split_independence,
+)
+
+
+def _chain(length, prefix='t'):
+    """Build tickets where each ticket depends on the previous one."""
+    tickets = [{'id': f'{prefix}0', 'depends_on': []}]
+    for i in range(1, length):
+        tickets.append({'id': f'{prefix}{i}', 'depends_on': [f'{prefix}{i - 1}']})
+    return tickets
+
+
+class TestParseSpecialistOutput:
+    """Test cases for parse_specialist_output function."""
+
+    def test_extracts_split_epics_from_json_line(self):
+        """Should find the split_epics JSON line among other output."""
+        output = (
+            'Analyzing epic...\n'
+            '{"status": "working"}\n'
+            '  {"split_epics": '
+            '[{"name": "auth", "path": "a.yaml", "ticket_count": 7}]}  \n'
+            'Done.\n'
+        )
+
+        result = parse_specialist_output(output)
+
+        assert result == [{'name': 'auth', 'path': 'a.yaml', 'ticket_count': 7}]
+
+    def test_extracts_split_epics_from_bytes(self):
+        """Should scan raw subprocess bytes without decoding the whole output."""
+        output = 'Résumé…\n{"split_epics": [{"name": "é", "ticket_count": 1}]}\n'
+        output = output.encode()
+
+        result = parse_specialist_output(output)
+
+        assert result == [{'name': 'é', 'ticket_count': 1}]
+
+    def test_extracts_pretty_printed_json(self):
+        """Should decode a split_epics object spanning several lines."""
+        output = (
+            'Here is the split:\n'
+            '{\n'
+            '  "split_epics": [\n'
+            '    {"name": "auth", "path": "a.yaml", "ticket_count": 7}\n'
+            '  ]\n'
+            '}\n'
+            'Let me know if you need changes.\n'
+        )
+
+        result = parse_specialist_output(output)
+
+        assert result == [{'name': 'auth', 'path': 'a.yaml', 'ticket_count': 7}]
+
+    def test_skips_lines_that_only_mention_split_epics(self):
+        """Should keep scanning if a JSON line lacks the split_epics key."""
+        output = '{"note": "split_epics pending"}\n{"split_epics": []}\n'
+
+        assert parse_specialist_output(output) == []
+
+    def test_finds_split_epics_after_other_keys(self):
+        """Should accept split_epics when it is not the object's first key."""
+        output = 'Done.\n{"status": "ok", "split_epics": [{"name": "a"}]}\n'
+
+        assert parse_specialist_output(output) == [{'name': 'a'}]
+
+    def test_skips_prose_mention_before_result(self):
+        """Should skip an undecodable mention of the format in prose."""
+        output = (
+            'I will print {"split_epics": [...]} when done\n'
+            '{"split_epics": [{"name": "a"}]}\n'
+        )
+
+        assert parse_specialist_output(output) == [{'name': 'a'}]
+        assert parse_specialist_output(output.encode()) == [{'name': 'a'}]
+
+    def test_raises_when_no_json_found(self):
+        """Should raise RuntimeError if no split_epics JSON is present."""
+        with pytest.raises(RuntimeError) as exc_info:
+            parse_specialist_output('no json here\n')
+
+        assert 'Could not find split_epics JSON' in str(exc_info.value)
+
+    def test_raises_on_malformed_json(self):
+        """Should raise RuntimeError if the candidate line is not valid JSON."""
+        with pytest.raises(RuntimeError) as exc_info:
+            parse_specialist_output('{"split_epics": [\n')
+
+        assert 'Failed to parse specialist output' in str(exc_info.value)
+
+
+class TestCollectSplitEpicsOutput:
+    """Test cases for _collect_split_epics_output function."""
+
+    def test_keeps_pretty_printed_json_whole(self):
+        """Should keep an opening brace on its own line when streaming."""
+        lines = [
+            b'Here is the split:\n',
+            b'{\n',
+            b'  "split_epics": [\n',
+            b'    {"name": "auth", "path": "a.yaml", "ticket_count": 7}\n',
+            b'  ]\n',
+            b'}\n',
+            b'Let me know if you need changes.\n',
+        ]
+
+        output = _collect_split_epics_output(iter(lines))
+
+        assert output.startswith(b'{\n')
+        assert parse_specialist_output(output) == [
+            {'name': 'auth', 'path': 'a.yaml', 'ticket_count': 7}
+        ]
+
+    def test_drops_output_before_the_result(self):
+        """Should discard prose preceding the split_epics object."""
+        lines = [b'Analyzing epic...\n', b'Result: {"split_epics": []}\n']
+
+        output = _collect_split_epics_output(iter(lines))
+
+        assert output == b'Result: {"split_epics": []}\n'
+        assert parse_specialist_output(output) == []
+
+    def test_keeps_result_with_split_epics_after_other_keys(self):
+        """Should keep an object opened mid-line whose first key is not split_epics."""
+        lines = [
+            b'Result: {"status": "ok",\n',
+            b'  "split_epics": [{"name": "a"}]}\n',
+        ]
+
+        output = _collect_split_epics_output(iter(lines))
+
+        assert parse_specialist_output(output) == [{'name': 'a'}]
+
+    def test_returns_empty_without_candidate_lines(self):
+        """Should return no bytes if nothing looks like the result."""
+        assert _collect_split_epics_output(iter([b'no json here\n'])) == b''
+
+
+class TestDetectCircularDependencies:
+    """Test cases for detect_circular_dependencies function."""
+
+    def test_returns_empty_for_acyclic_graph(self):
+        """Should not report groups when there are no cycles."""
+        tickets = [
+            {'id': 'a', 'depends_on': ['b', 'c']},
+            {'id': 'b', 'depends_on': ['c']},
+            {'id': 'c'},
+        ]
+
+        assert detect_circular_dependencies(tickets) == []
+
+    def test_detects_simple_cycle(self):
+        """Should report all tickets in a cycle as one group."""
+        tickets = [
+            {'id': 'a', 'depends_on': ['b']},
+            {'id': 'b', 'depends_on': ['c']},
+            {'id': 'c', 'depends_on': ['a']},
+            {'id': 'd', 'depends_on': ['a']},
+        ]
+
+        assert detect_circular_dependencies(tickets) == [{'a', 'b', 'c'}]
+
+    def test_detects_self_dependency(self):
+        """Should report a ticket that depends on itself."""
+        tickets = [{'id': 'a', 'depends_on': ['a']}, {'id': 'b', 'depends_on': ['a']}]
+
+        assert detect_circular_dependencies(tickets) == [{'a'}]
+
+    def test_detects_multiple_independent_cycles(self):
+        """Should report each independent cycle as its own group."""
+        tickets = [
+            {'id': 'a', 'depends_on': ['b']},
+            {'id': 'b', 'depends_on': ['a']},
+            {'id': 'c', 'depends_on': ['d']},
+            {'id': 'd', 'depends_on': ['c', 'a']},
+        ]
+
+        groups = detect_circular_dependencies(tickets)
+
+        assert sorted(groups, key=sorted) == [{'a', 'b'}, {'c', 'd'}]
+
+    def test_ignores_unknown_dependencies(self):
+        """Should treat dependencies outside the epic as leaves."""
+        tickets = [
+            {'id': 'a', 'depends_on': ['external']},
+            {'id': 'b', 'depends_on': None},
+        ]
+
+        assert detect_circular_dependencies(tickets) == []
+
+    def test_handles_chains_deeper_than_recursion_limit(self):
+        """Should not recurse per ticket on very deep chains."""
+        tickets = _chain(5000)
+        tickets[0]['depends_on'] = ['t4999']
+
+        groups = detect_circular_dependencies(tickets)
+
+        assert len(groups) == 1
+        assert len(groups[0]) == 5000
+
+
+class TestDetectLongChains:
+    """Test cases for detect_long_chains function."""
+
+    def test_returns_empty_for_short_chains(self):
+        """Should not report chains shorter than 12 tickets."""
+        assert detect_long_chains(_chain(11)) == []
+
+    def test_reports_chain_from_ticket_to_deepest_dependency(self):
+        """Should report chains of 12+ tickets ordered from dependent to root."""
+        chains = detect_long_chains(_chain(13))
+
+        assert chains[0] == [f't{i}' for i in range(12, -1, -1)]
+        assert [len(chain) for chain in chains] == [13]
+
+    def test_reports_each_maximal_chain_once(self):
+        """Should list branches sharing a tail, but not the tail alone."""
+        tickets = _chain(12) + [
+            {'id': 'a', 'depends_on': ['t11']},
+            {'id': 'b', 'depends_on': ['a']},
+            {'id': 'c', 'depends_on': ['t11']},
+        ]
+
+        chains = detect_long_chains(tickets)
+
+        assert chains == [
+            ['b', 'a'] + [f't{i}' for i in range(11, -1, -1)],
+            ['c'] + [f't{i}' for i in range(11, -1, -1)],
+        ]
+
+    def test_follows_longest_branch(self):
+        """Should pick the deepest dependency when a ticket has several."""
+        tickets = _chain(12) + [
+            {'id': 'shortcut', 'depends_on': []},
+            {'id': 'top', 'depends_on': ['shortcut', 't11']},
+        ]
+
+        chains = detect_long_chains(tickets)
+
+        assert chains[0] == ['top'] + [f't{i}' for i in range(11, -1, -1)]
+
+    def test_measures_chains_built_on_top_of_a_cycle(self):
+        """Should count a circular group's tickets, not drop its dependents."""
+        tickets = [
+            {'id': 'x', 'depends_on': ['y']},
+            {'id': 'y', 'depends_on': ['x']},
+        ] + _chain(20)
+        tickets[2]['depends_on'] = ['x']
+
+        chains = detect_long_chains(tickets)
+
+        assert chains == [[f't{i}' for i in range(19, -1, -1)] + ['x', 'y']]
+
+    def test_handles_chains_deeper_than_recursion_limit(self):
+        """Should not recurse per ticket on very deep chains."""
+        chains = detect_long_chains(_chain(2000))
+
+        assert len(chains[0]) == 2000
+
+
+class TestFindChainLongerThan:
+    """Test cases for find_chain_longer_than function."""
+
+    def test_returns_none_when_chains_fit(self):
+        """Should return None when no chain exceeds the limit."""
+        assert find_chain_longer_than(_chain(12), 12) is None
+
+    def test_returns_chain_exceeding_limit(self):
+        """Should return a valid chain with more tickets than the limit."""
+        tickets = _chain(30)
+
+        chain = find_chain_longer_than(tickets, 12)
+
+        assert len(chain) > 12
+        deps = {t['id']: t['depends_on'] for t in tickets}
+        assert all(chain[i + 1] in deps[chain[i]] for i in range(len(chain) - 1))
+
+    def test_counts_circular_group_tickets(self):
+        """Should treat a circular group as one link holding all its tickets."""
+        tickets = [{'id': 'a', 'depends_on': ['b']}, {'id': 'b', 'depends_on': ['a']}]
+
+        assert find_chain_longer_than(tickets, 2) is None
+        assert find_chain_longer_than(tickets, 1) == ['a', 'b']
+
+    def test_finds_chain_above_a_cycle(self):
+        """Should still enforce the limit for tickets that depend on a cycle."""
+        tickets = [
+            {'id': 'x', 'depends_on': ['y']},
+            {'id': 'y', 'depends_on': ['x']},
+        ] + _chain(20)
+        tickets[2]['depends_on'] = ['x']
+
+        chain = find_chain_longer_than(tickets, 12)
+
+        assert chain is not None
+        assert len(chain) > 12
+        assert chain[-2:] == ['x', 'y']
+
+
+class TestParseEpicYamlCached:
+    """Test cases for parse_epic_yaml_cached function."""
+
+    def test_reuses_result_until_file_changes(self):
+        """Should return the cached parse until the file's mtime changes."""
+        epic_data = {'epic': 'Test Epic', 'ticket_count': 1, 'tickets': [{'id': 'a'}]}
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(epic_data, f)
+            temp_path = f.name
+
+        try:
+            first = parse_epic_yaml_cached(temp_path)
+            assert parse_epic_yaml_cached(temp_path) is first
+
+            epic_data['ticket_count'] = 2
+            with open(temp_path, 'w') as f:
+                yaml.dump(epic_data, f)
+            stat = os.stat(temp_path)
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert parse_epic_yaml_cached(temp_path)['ticket_count'] == 2
+        finally:
+            os.unlink(temp_path)
+
+    def test_raises_file_not_found_for_missing_file(self):
+        """Should surface parse_epic_yaml's error for missing files."""
+        with pytest.raises(FileNotFoundError) as exc_info:
+            parse_epic_yaml_cached('/nonexistent/path/to/epic.yaml')
+
+        assert 'Epic file does not exist' in str(exc_info.value)
+
+
+class TestValidateSplitIndependence:
+    """Test cases for validate_split_independence function."""
+
+    def _write_epic(self, directory, name, tickets):
+        path = os.path.join(directory, f'{name}.epic.yaml')
+        with open(path, 'w') as f:
+            yaml.dump(
+                {'epic': name, 'ticket_count': len(tickets), 'tickets': tickets}, f
+            )
+        return {'name': name, 'path': path, 'ticket_count': len(tickets)}
+
+    def test_accepts_independent_epics(self):
+        """Should pass when dependencies stay within each split epic."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            split_epics = [
+                self._write_epic(
+                    temp_dir, 'one', [{'id': 'a'}, {'id': 'b', 'depends_on': ['a']}]
+                ),
+                self._write_epic(
+                    temp_dir, 'two', [{'id': 'c', 'depends_on': ['external']}]
+                ),
+            ]
+
+            assert validate_split_independence(split_epics, {}) == (True, "")
+
+    def test_rejects_cross_epic_dependency(self):
+        """Should fail with a descriptive message on cross-epic dependencies."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            split_epics = [
+                self._write_epic(temp_dir, 'one', [{'id': 'a'}]),
+                self._write_epic(temp_dir, 'two', [{'id': 'b', 'depends_on': ['a']}]),
+            ]
+
+            is_valid, error_msg = validate_split_independence(split_epics, {})
+
+            assert not is_valid
+            assert error_msg == (
+                "Cross-epic dependency found: ticket 'b' in epic 'two' "
+                "depends on 'a' in epic 'one'"
+            )
+
+    def test_skips_missing_split_epic_files(self):
+        """Should ignore split epics whose files do not exist."""
+        split_epics = [
+            {'name': 'ghost', 'path': '/nonexistent/ghost.epic.yaml'},
+            {'name': 'none'},
+        ]
+
+        assert validate_split_independence(split_epics, {}) == (True, "")
+
+
+class TestCreateSplitSubdirectories:
+    """Test cases for create_split_subdirectories function."""
+
+    def test_creates_epic_and_tickets_directories(self, monkeypatch):
+        """Should create an epic directory with a tickets/ subdirectory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.chdir(temp_dir)
+            base_dir = os.path.join(temp_dir, '.epics', 'feature')
+
+            created = create_split_subdirectories(base_dir, ['part-a'])
+
+            assert created == [os.path.join(os.path.realpath(base_dir), 'part-a')]
+            assert os.path.isdir(os.path.join(created[0], 'tickets'))
+
+    def test_rejects_sibling_with_epics_prefix(self, monkeypatch):
+        """Should not treat .epics-old/ as inside .epics/."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.chdir(temp_dir)
+            base_dir = os.path.join(temp_dir, '.epics-old', 'feature')
+
+            with pytest.raises(ValueError) as exc_info:
+                create_split_subdirectories(base_dir, ['part-a'])
+
+            assert 'outside .epics/' in str(exc_info.value)
+            assert not os.path.exists(base_dir)
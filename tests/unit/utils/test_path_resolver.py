@@ -0,0 +1,81 @@
+"""Tests for path resolver utility."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from cli.utils.path_resolver import PathResolutionError, resolve_file_argument
+
+
+class TestResolveFileArgument:
+    """Test cases for resolve_file_argument function."""
+
+    def test_returns_existing_file(self):
+        """Should return the path unchanged when it is an existing file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spec = Path(temp_dir) / 'feature-spec.md'
+            spec.write_text('# Spec')
+
+            assert resolve_file_argument(str(spec)) == spec
+
+    def test_strips_line_number_notation(self):
+        """Should strip trailing ':<line>' notation before resolving."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spec = Path(temp_dir) / 'feature-spec.md'
+            spec.write_text('# Spec')
+
+            assert resolve_file_argument(f'{spec}:123') == spec
+
+    def test_infers_single_matching_file_from_directory(self):
+        """Should infer the file when a directory has exactly one match."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spec = Path(temp_dir) / 'feature-SPEC.md'
+            spec.write_text('# Spec')
+            (Path(temp_dir) / 'notes.md').write_text('# Notes')
+            os.mkdir(Path(temp_dir) / 'spec-dir')
+
+            result = resolve_file_argument(temp_dir, expected_pattern='spec')
+
+            assert result == spec
+
+    def test_raises_when_directory_has_no_match(self):
+        """Should raise if no file in the directory matches the pattern."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'notes.md').write_text('# Notes')
+
+            with pytest.raises(PathResolutionError) as exc_info:
+                resolve_file_argument(
+                    temp_dir, expected_pattern='spec', arg_name='planning document'
+                )
+
+            assert 'Planning document not found' in str(exc_info.value)
+
+    def test_raises_when_directory_match_is_ambiguous(self):
+        """Should raise if multiple files in the directory match the pattern."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'a-spec.md').write_text('# A')
+            (Path(temp_dir) / 'b-spec.md').write_text('# B')
+
+            with pytest.raises(PathResolutionError) as exc_info:
+                resolve_file_argument(temp_dir, expected_pattern='spec')
+
+            assert 'ambiguous' in str(exc_info.value)
+            assert 'a-spec.md' in str(exc_info.value)
+            assert 'b-spec.md' in str(exc_info.value)
+
+    def test_raises_for_directory_without_pattern(self):
+        """Should raise if given a directory and no pattern to infer from."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(PathResolutionError) as exc_info:
+                resolve_file_argument(temp_dir)
+
+            assert 'is a directory' in str(exc_info.value)
+
+    def test_raises_for_missing_path(self):
+        """Should raise if the path does not exist."""
+        with pytest.raises(PathResolutionError) as exc_info:
+            resolve_file_argument('/nonexistent/path/spec.md', arg_name='epic file')
+
+        assert 'Epic file not found' in str(exc_info.value)